@@ -3,7 +3,9 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
+import functools
 import os
+import string
 import sys
 
 from janim import __version__
@@ -19,6 +21,8 @@ release = __version__
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
+# 这些扩展的指令（例如 translatable-tab）在各语言的文档源码中都有使用，
+# 因此不按 language 条件加载
 extensions = [
     'sphinx.ext.autodoc',
     'sphinx_copybutton',
@@ -35,7 +39,28 @@ autodoc_member_order = 'bysource'
 templates_path = ['_templates']
 exclude_patterns = ['._*', '**/._*']
 
-language = 'zh_CN'
+# 语言代码的别名映射，键为已经过 _normalize_language 折叠后的形式
+_LANG_MAP = {
+    'zh': 'zh_CN',
+    'zh_cn': 'zh_CN',
+    'en': 'en',
+    'en_us': 'en',
+}
+
+# 一次遍历完成 '-' -> '_' 与 ASCII 大写折叠
+_LANG_TRANS = str.maketrans(
+    string.ascii_uppercase + '-',
+    string.ascii_lowercase + '_',
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _normalize_language(value: str) -> str:
+    key = value.strip().translate(_LANG_TRANS)
+    return _LANG_MAP.get(key, value)
+
+
+language = _normalize_language(os.environ.get('READTHEDOCS_LANGUAGE', 'zh_CN'))
 locale_dirs = ['locales/']
 gettext_compact = False     # optional
 
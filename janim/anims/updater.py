@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from contextvars import ContextVar
-from dataclasses import dataclass
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Self
 
@@ -25,7 +25,7 @@ from janim.utils.simple_functions import clip
 _ = get_local_strings('updater')
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdaterParams:
     '''
     ``Updater`` 调用时会传递的参数，用于标注时间信息以及动画进度
@@ -37,6 +37,8 @@ class UpdaterParams:
 
     _updater: _DataUpdater | GroupUpdater | None
 
+    token: Token = field(init=False, repr=False, default=None)
+
     @property
     def elapsed(self) -> float:
         return self.global_t - self.range.at
@@ -49,7 +51,7 @@ class UpdaterParams:
         updater_params_ctx.reset(self.token)
 
 
-@dataclass
+@dataclass(slots=True)
 class StepUpdaterParams:
     '''
     :class:`StepUpdater` 调用时会传递的参数，用于标注时间信息以及动画进度
@@ -60,6 +62,8 @@ class StepUpdaterParams:
 
     _updater: StepUpdater
 
+    token: Token = field(init=False, repr=False, default=None)
+
     def __enter__(self) -> Self:
         self.token = updater_params_ctx.set(self)
         return self
@@ -76,9 +80,8 @@ type ItemUpdaterFn = Callable[[UpdaterParams], Item]
 type StepUpdaterFn[T] = Callable[[T, UpdaterParams], Any]
 
 
-def _call_two_func(func1: Callable, func2: Callable, *args, **kwargs) -> None:
-    func1(*args, **kwargs)
-    func2(*args, **kwargs)
+def _default_extra(item: Item) -> None:
+    return None
 
 
 class DataUpdater[T: Item](Animation):
@@ -116,7 +119,7 @@ class DataUpdater[T: Item](Animation):
         item: T,
         func: DataUpdaterFn[T],
         *,
-        extra: Callable[[Item], Any | None] = lambda x: None,
+        extra: Callable[[Item], Any | None] = _default_extra,
         lag_ratio: float = 0,
         show_at_begin: bool = True,
         hide_at_end: bool = False,
@@ -127,7 +130,7 @@ class DataUpdater[T: Item](Animation):
     ):
         super().__init__(**kwargs)
         self.item = item
-        self.func = func
+        self.funcs: list[DataUpdaterFn[T]] = [func]
         self.extra = extra
         self.lag_ratio = lag_ratio
         self.show_at_begin = show_at_begin
@@ -137,8 +140,7 @@ class DataUpdater[T: Item](Animation):
         self.root_only = root_only
 
     def add_post_updater(self, func: DataUpdaterFn[T]) -> Self:
-        orig_func = self.func
-        self.func = lambda data, p: _call_two_func(orig_func, func, data, p)
+        self.funcs.append(func)
         return self
 
     def _time_fixed(self) -> None:
@@ -152,13 +154,18 @@ class DataUpdater[T: Item](Animation):
                 items.append(item)
         count = len(items)
 
+        extra = None if self.extra is _default_extra else self.extra
+        end = self.t_range.end
+        become_at_end = self.become_at_end and end is not FOREVER
+        item_appearances = self.timeline.item_appearances
+
         for i, item in enumerate(items):
-            stack = self.timeline.item_appearances[item].stack
+            stack = item_appearances[item].stack
 
             sub_updater = _DataUpdater(self,
                                        item,
-                                       self.func,
-                                       self.extra(item),
+                                       self.funcs,
+                                       None if extra is None else extra(item),
                                        self.lag_ratio,
                                        i,
                                        count,
@@ -167,9 +174,9 @@ class DataUpdater[T: Item](Animation):
             sub_updater.transfer_params(self)
             sub_updater.finalize()
 
-            if self.become_at_end and self.t_range.end is not FOREVER:
-                item.restore(stack.compute(self.t_range.end, True, get_at_left=True))
-                stack.detect_change(item, self.t_range.end, force=True)
+            if become_at_end:
+                item.restore(stack.compute(end, True, get_at_left=True))
+                stack.detect_change(item, end, force=True)
 
 
 class _DataUpdater(ItemAnimation):
@@ -177,7 +184,7 @@ class _DataUpdater(ItemAnimation):
         self,
         generate_by: DataUpdater,
         item: Item,
-        func: DataUpdaterFn,
+        funcs: list[DataUpdaterFn],
         extra_data: Any | None,
         lag_ratio: float,
         index: int,
@@ -186,27 +193,30 @@ class _DataUpdater(ItemAnimation):
     ):
         super().__init__(item, **kwargs)
         self._generate_by = generate_by
-        self.func = func
+        self.funcs = funcs
         self.extra_data = extra_data
         self.lag_ratio = lag_ratio
         self.index = index
         self.count = count
 
+        # get_sub_alpha 在每帧都会被调用，这两个值在此预先算好
+        self._full_length = (count - 1) * lag_ratio + 1
+        self._lower = index * lag_ratio
+
     def apply(self, data: Item, p: ItemAnimation.ApplyParams) -> None:
         with UpdaterParams(p.global_t,
                            self.get_sub_alpha(self.get_alpha_on_global_t(p.global_t)),
                            self.t_range,
                            self.extra_data,
                            self) as params:
-            self.func(data, params)
+            for func in self.funcs:
+                func(data, params)
 
     def get_sub_alpha(self, alpha: float) -> float:
         '''依据 ``lag_ratio`` 得到特定子物件的 ``sub_alpha``'''
-        lag_ratio = self.lag_ratio
-        full_length = (self.count - 1) * lag_ratio + 1
-        value = alpha * full_length
-        lower = self.index * lag_ratio
-        return clip((value - lower), 0, 1)
+        # 每帧调用，内联 clip 以避免一次函数调用
+        value = alpha * self._full_length - self._lower
+        return 0. if value < 0. else (1. if value > 1. else value)
 
 
 class GroupUpdater[T: Item](Animation):
@@ -229,7 +239,7 @@ class GroupUpdater[T: Item](Animation):
     ):
         super().__init__(**kwargs)
         self.item = item
-        self.func = func
+        self.funcs: list[GroupUpdaterFn[T]] = [func]
         self.show_at_begin = show_at_begin
         self.hide_at_end = hide_at_end
         self.become_at_end = become_at_end
@@ -237,11 +247,10 @@ class GroupUpdater[T: Item](Animation):
         self.applied: bool = False
 
     def add_post_updater(self, func: GroupUpdaterFn[T]) -> Self:
-        orig_func = self.func
-        self.func = lambda data, p: _call_two_func(orig_func, func, data, p)
+        self.funcs.append(func)
         return self
 
-    @dataclass
+    @dataclass(slots=True)
     class DataGroup:
         data: Item
         stack: AnimStack
@@ -250,14 +259,17 @@ class GroupUpdater[T: Item](Animation):
     def _time_fixed(self) -> None:
         self.data = self.item.copy()
 
-        sub_items = list(self.item.walk_self_and_descendants())
+        # 各种遍历只做一次，后面复用这些序列即可
+        sub_items = tuple(self.item.walk_self_and_descendants())
+        datas = tuple(self.data.walk_self_and_descendants())
+        item_appearances = self.timeline.item_appearances
         stacks = [
-            self.timeline.item_appearances[item].stack
+            item_appearances[item].stack
             for item in sub_items
         ]
         updaters = [
             _GroupUpdater(self, item, data, stacks, show_at_begin=self.show_at_begin, hide_at_end=self.hide_at_end)
-            for item, data in zip(sub_items, self.data.walk_self_and_descendants())
+            for item, data in zip(sub_items, datas)
         ]
 
         if self.become_at_end and self.t_range.end is not FOREVER:
@@ -265,7 +277,8 @@ class GroupUpdater[T: Item](Animation):
                 item.restore(stack.compute(self.t_range.end, True, get_at_left=True))
 
             with UpdaterParams(self.t_range.end, 1, self.t_range, None, self) as params:
-                self.func(self.item, params)
+                for func in self.funcs:
+                    func(self.item, params)
 
             for item, stack in zip(sub_items, stacks):
                 stack.detect_change(item, self.t_range.end, force=True)
@@ -283,7 +296,8 @@ class GroupUpdater[T: Item](Animation):
                            self.t_range,
                            None,
                            self) as params:
-            self.func(self.data, params)
+            for func in self.funcs:
+                func(self.data, params)
 
         self.applied = True
 
@@ -524,10 +538,12 @@ class ItemUpdater(Animation):
         return ret
 
     def get_renderer(self, item: Item) -> Renderer:
-        renderer = self.renderers.get(item.__class__, None)
-        if renderer is None:
+        # 命中缓存是常态，try 路径只有一次字典查找
+        try:
+            return self.renderers[item.__class__]
+        except KeyError:
             renderer = self.renderers[item.__class__] = item.renderer_cls()
-        return renderer
+            return renderer
 
     def render_calls_callback(self):
         global_t = Animation.global_t_ctx.get()
@@ -539,8 +555,9 @@ class ItemUpdater(Animation):
                            self) as params:
             ret = self.call(params)
 
+        get_renderer = self.get_renderer
         return [
-            (item, self.get_renderer(item).render)
+            (item, get_renderer(item).render)
             for item in ret.walk_self_and_descendants()
         ]
 
@@ -572,7 +589,7 @@ class StepUpdater[T: Item](Animation):
     ):
         super().__init__(rate_func=rate_func, **kwargs)
         self.item = item
-        self.func = func
+        self.funcs: list[StepUpdaterFn[T]] = [func]
 
         self.step = step
         self.persistent_cache_step = persistent_cache_step
@@ -587,8 +604,7 @@ class StepUpdater[T: Item](Animation):
         self.progress_bar = progress_bar
 
     def add_post_updater(self, updater: StepUpdaterFn[T]) -> Self:
-        orig_func = self.func
-        self.func = lambda data, p: _call_two_func(orig_func, updater, data, p)
+        self.funcs.append(updater)
 
     def _time_fixed(self) -> None:
         for item in self.item.walk_self_and_descendants(self.root_only):
@@ -600,7 +616,7 @@ class StepUpdater[T: Item](Animation):
 
             sub_updater = _StepUpdater(self,
                                        item,
-                                       self.func,
+                                       self.funcs,
                                        self.step,
                                        self.persistent_cache_step,
                                        self.become_at_end,
@@ -616,7 +632,7 @@ class _StepUpdater(ItemAnimation):
         self,
         generate_by: StepUpdater,
         item: Item,
-        func: StepUpdaterFn,
+        funcs: list[StepUpdaterFn],
         step: float,
         persistent_cache_step: float,
         become_at_end: bool,
@@ -629,7 +645,7 @@ class _StepUpdater(ItemAnimation):
         self._generate_by = generate_by
         self._cover_previous_anims = True
 
-        self.func = func
+        self.funcs = funcs
         self.step = step
         self.persistent_cache_step = persistent_cache_step
         self.become_at_end = become_at_end
@@ -706,7 +722,8 @@ class _StepUpdater(ItemAnimation):
                                    self.t_range,
                                    computing_n,
                                    self) as params:
-                self.func(data, params)
+                for func in self.funcs:
+                    func(data, params)
 
             computing_block = computing_n // self.pcache_base
             mod = computing_n % self.pcache_base
@@ -134,9 +134,12 @@ class Component[ItemT](refresh.Refreshable, metaclass=_CmptMeta):
 
     def walk_same_cmpt_of_descendants_without_mock(self) -> Generator[Self, None, None]:
         item = self.bind.at_item
-        if not item.stored:
+        # 没有子物件时直接返回，避免空跑一遍 walk_descendants（批量设置样式时叶子物件是最常见的情况）
+        if not item.stored and item.children:
+            # 将 get_same_cmpt_without_mock 内联并提出 key，免去循环内的方法调用与属性链查找
+            key = self.bind.key
             for item in item.walk_descendants(self.bind.decl_cls):
-                cmpt = self.get_same_cmpt_without_mock(item)
+                cmpt = item.components.get(key, None)
                 if cmpt is None:
                     continue
                 yield cmpt
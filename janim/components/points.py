@@ -282,7 +282,7 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             '''
             得到从中心发出的方向为 ``direction`` 的射线与边界框的交点
             '''
-            direction = np.array(direction)
+            direction = np.asarray(direction)
 
             dl, center, ur = self.data
             corner_vect = (ur - center)
@@ -446,7 +446,7 @@ class Cmpt_Points[ItemT](Component[ItemT]):
         '''
         将矩阵变换作用于 ``points``；以默认的原点作用变换，而不是物件的中心
         '''
-        matrix = np.array(matrix)
+        matrix = np.asarray(matrix)
         if matrix.shape not in ((2, 2), (3, 3)):
             raise InvaildMatrixError(
                 _('Only 2x2 or 3x3 matrix are valid, but a {shape} matrix was passed in')
@@ -571,6 +571,11 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             else:
                 scale_factor = min(scale_factor, -min_scale_factor)
 
+            if scale_factor == 1:
+                # 倍数为 1 时没有效果，跳过对所有点的变换
+                # （例如 GrowFromPoint 在结束状态会以 alpha=1 调用 scale）
+                return self
+
         self.apply_points_fn(
             lambda points: scale_factor * points,
             about_point=about_point,
@@ -1143,7 +1148,7 @@ class Cmpt_Points[ItemT](Component[ItemT]):
             self.get_same_cmpt(item)
             for item in self.bind.at_item.children
         ]
-        offset = np.array(offset)
+        offset = np.asarray(offset)
 
         for cmpt1, cmpt2 in zip(cmpts, cmpts[1:]):
             delta = cmpt2.box.get(aligned_edge) - cmpt1.box.get(aligned_edge)
@@ -192,10 +192,10 @@ class Cmpt_Rgbas[ItemT](Component[ItemT]):
                 cmpt_alpha = cmpt.get()[:, 3] if alpha is None else alpha
                 length = max(len(cmpt_color), len(cmpt_alpha))
 
-                rgbas = np.hstack([
-                    resize_with_interpolation(cmpt_color.astype(float), length),
-                    resize_with_interpolation(cmpt_alpha.astype(float), length).reshape((length, 1))
-                ])
+                # 直接写入预分配的结果数组，避免 hstack/reshape 产生的中间数组
+                rgbas = np.empty((length, 4))
+                rgbas[:, :3] = resize_with_interpolation(cmpt_color.astype(float, copy=False), length)
+                rgbas[:, 3] = resize_with_interpolation(cmpt_alpha.astype(float, copy=False), length)
                 cmpt.set_rgbas(rgbas)
 
         return self
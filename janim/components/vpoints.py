@@ -22,7 +22,8 @@ from janim.utils.bezier import (PathBuilder,
                                 smooth_quadratic_path)
 from janim.utils.data import AlignedData
 from janim.utils.paths import PathFunc, straight_path
-from janim.utils.space_ops import (get_norm, get_unit_normal, normalize,
+from janim.utils.space_ops import (consider_points_equal, get_norm,
+                                   get_unit_normal, normalize,
                                    rotation_between_vectors)
 
 _ = get_local_strings('vpoints')
@@ -309,7 +310,7 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
     def start_direction_from_points(points: np.ndarray) -> np.ndarray:
         start = points[0]
         for pos in points[1:]:
-            if not np.isclose(start, pos).all():
+            if not consider_points_equal(start, pos):
                 return pos - start
         return RIGHT
 
@@ -317,7 +318,7 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
     def end_direction_from_points(points: np.ndarray) -> np.ndarray:
         end = points[-1]
         for pos in points[-2::-1]:
-            if not np.isclose(end, pos).all():
+            if not consider_points_equal(end, pos):
                 return end - pos
         return RIGHT
 
@@ -542,10 +543,16 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         if not self.has():
             self.set([points[0]])
 
-        builder = PathBuilder(start_point=self.get_end())
-        for point in points:
-            builder.line_to(point)
-        self.extend(builder.get()[1:])
+        # 等价于从当前末尾开始对每个点调用 PathBuilder.line_to，一次性构造后仅 extend 一次
+        points = np.asarray(points)
+        prev = np.empty_like(points, dtype=np.float64)
+        prev[0] = self.get_end()
+        prev[1:] = points[:-1]
+
+        new_points = np.empty((2 * len(points), 3))
+        new_points[0::2] = (prev + points) * 0.5
+        new_points[1::2] = points
+        self.extend(new_points)
 
         return self
 
@@ -553,10 +560,12 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         '''
         将点数据设置为由 ``points`` 构成的折线
         '''
-        builder = PathBuilder(start_point=points[0])
-        for point in points[1:]:
-            builder.line_to(point)
-        self.set(builder.get())
+        # 等价于对每个点调用 PathBuilder.line_to，但一次性交错写入锚点与中点
+        points = np.asarray(points)
+        new_points = np.empty((2 * len(points) - 1, 3))
+        new_points[0::2] = points
+        new_points[1::2] = (points[:-1] + points[1:]) * 0.5
+        self.set(new_points)
         return self
 
     # endregion
@@ -574,26 +583,34 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         '''
         points = self.get()
 
-        vectors_count = self.curves_count() + 1
+        vectors_count = max(0, len(points) - 1) // 2 + 1
         v1 = np.empty((vectors_count, 3), dtype=np.float32)
         v2 = np.empty((vectors_count, 3), dtype=np.float32)
 
         v1[1:] = points[2::2] - points[1::2]
         v2[:-1] = points[1::2] - points[0:-1:2]
 
-        ends = np.array(self.get_subpath_end_indices())
-        starts = [0, *(ends[:-1] + 2)]
-        for start, end in zip(starts, ends):
-            if start == end:
-                continue
-            i1 = start // 2
-            i2 = end // 2
-            if np.isclose(points[start], points[end]).all():
-                v1[i1] = v1[i2]
-                v2[i2] = v2[i1]
-            else:
-                v1[i1] = v2[i1]
-                v2[i2] = v1[i2]
+        ends = self.subpath_end_indices_from_points(points)
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 2
+
+        # 去除只有单个点的子路径，并对剩余子路径一次性判断是否闭合，
+        # 各子路径的下标区间互不相交，因此可以使用花式索引批量修正端点处的方向向量
+        mask = starts != ends
+        starts = starts[mask]
+        ends = ends[mask]
+        i1 = starts // 2
+        i2 = ends // 2
+        closed = np.isclose(points[starts], points[ends]).all(axis=1)
+
+        c1, c2 = i1[closed], i2[closed]
+        v1[c1] = v1[c2]
+        v2[c2] = v2[c1]
+
+        o1, o2 = i1[~closed], i2[~closed]
+        v1[o1] = v2[o1]
+        v2[o2] = v1[o2]
 
         v1 /= np.sqrt(v1[:, 0]**2 + v1[:, 1]**2 + v1[:, 2]**2)[:, np.newaxis]
         v2 /= np.sqrt(v2[:, 0]**2 + v2[:, 1]**2 + v2[:, 2]**2)[:, np.newaxis]
@@ -659,16 +676,17 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
             return np.zeros(3)
 
         p0 = points[::2]
-        p1 = np.roll(p0, -1, axis=0)
 
         # Each term goes through all edges [(x0, y0, z0), (x1, y1, z1)]
-        sums = p0 + p1
-        diffs = p1 - p0
-        return 0.5 * np.array([
-            (sums[:, 1] * diffs[:, 2]).sum(),  # Add up (y0 + y1)*(z1 - z0)
-            (sums[:, 2] * diffs[:, 0]).sum(),  # Add up (z0 + z1)*(x1 - x0)
-            (sums[:, 0] * diffs[:, 1]).sum(),  # Add up (x0 + x1)*(y1 - y0)
-        ])
+        # Add up (y0 + y1)*(z1 - z0), (z0 + z1)*(x1 - x0), (x0 + x1)*(y1 - y0)
+        # 直接写入预分配数组并单独处理回绕边，避免 np.roll 复制整个数组
+        sums = np.empty_like(p0)
+        diffs = np.empty_like(p0)
+        np.add(p0[:-1], p0[1:], out=sums[:-1])
+        np.subtract(p0[1:], p0[:-1], out=diffs[:-1])
+        sums[-1] = p0[-1] + p0[0]
+        diffs[-1] = p0[0] - p0[-1]
+        return 0.5 * np.einsum('ij,ij->j', sums[:, (1, 2, 0)], diffs[:, (2, 0, 1)])
 
     @property
     @Cmpt_Points.set.self_refresh
@@ -704,14 +722,27 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
 
     # region subpaths
 
+    @staticmethod
+    def subpath_end_indices_from_points(points: VectArray) -> np.ndarray:
+        '''
+        得到 ``points`` 中每个子路径结尾的下标数组
+        '''
+        handles = points[1::2]
+        indices = np.flatnonzero(np.isnan(handles[:, 0])) * 2
+        return np.append(indices, len(points) - 1)
+
+    @staticmethod
+    def walk_subpath_end_indices_from_points(points: VectArray) -> Generator[int, None, None]:
+        '''
+        遍历 ``points`` 中每个子路径结尾的下标
+        '''
+        yield from Cmpt_VPoints.subpath_end_indices_from_points(points)
+
     def walk_subpath_end_indices(self) -> Generator[int, None, None]:
         '''
         遍历每个子路径结尾的下标
         '''
-        points = self.get()
-        handles = points[1::2]
-        yield from np.where(np.isnan(handles[:, 0]))[0] * 2
-        yield len(points) - 1
+        return self.walk_subpath_end_indices_from_points(self.get())
 
     def get_subpath_end_indices(self) -> list[int]:
         return list(self.walk_subpath_end_indices())
@@ -724,15 +755,14 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
 
         对于闭合路径，结果中对应部分会被设置为 ``True``
         '''
-        result = np.full(self.count(), False)
+        points = self.get()
+        result = np.full(len(points), False)
         if len(result) == 0:
             return result
 
-        points = self.get()
-
         start_idx = 0
-        for end_idx in self.walk_subpath_end_indices():
-            if np.isclose(points[end_idx], points[start_idx]).all():
+        for end_idx in self.walk_subpath_end_indices_from_points(points):
+            if consider_points_equal(points[end_idx], points[start_idx]):
                 result[start_idx: end_idx + 1] = True
             start_idx = end_idx + 2
 
@@ -752,7 +782,9 @@ class Cmpt_VPoints[ItemT](Cmpt_Points[ItemT], impl=True):
         '''
         得到子路径列表
         '''
-        return self.get_parts_by_end_indices(self.get(), np.array(self.get_subpath_end_indices()))
+        points = self.get()
+        end_indices = self.subpath_end_indices_from_points(points)
+        return self.get_parts_by_end_indices(points, end_indices)
 
     def add_subpath(self, points: VectArray) -> Self:
         if not self.has():
@@ -56,13 +56,15 @@ class Arc(ArcCenter):
     ) -> None:
         super().__init__(arc_center=arc_center, **kwargs)
 
-        self.points.set(
-            quadratic_bezier_points_for_arc(
-                angle=angle,
-                start_angle=start_angle,
-                n_components=n_components
-            ) * radius + arc_center
+        # quadratic_bezier_points_for_arc 返回的是新数组，可以就地缩放平移，省去两个临时数组
+        points = quadratic_bezier_points_for_arc(
+            angle=angle,
+            start_angle=start_angle,
+            n_components=n_components
         )
+        points *= radius
+        points += arc_center
+        self.points.set(points)
 
     def get_arc_length(self) -> float:
         '''获取圆弧长度'''
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import math
 from typing import Literal, Self
 
 import numpy as np
 
 from janim.components.component import CmptInfo
+from janim.components.points import Cmpt_Points
 from janim.components.vpoints import Cmpt_VPoints
 from janim.constants import DEGREES, LEFT, ORIGIN, RIGHT, UP, WHITE
 from janim.items.geometry.arc import Arc, Dot
 from janim.items.points import Group, MarkedItem, Points
 from janim.items.vitem import DashedVItem, VItem
 from janim.typing import JAnimColor, Vect
+from janim.utils import refresh
 from janim.utils.bezier import PathBuilder
 from janim.utils.simple_functions import clip
 from janim.utils.space_ops import (angle_of_vector, get_arc_length, get_norm,
@@ -48,7 +51,11 @@ class Cmpt_VPoints_LineImpl[ItemT](Cmpt_VPoints[ItemT]):
         start, end = np.asarray(start), np.asarray(end)
 
         curr_start, curr_end = self.get_start_and_end()
-        if np.isclose(curr_start, curr_end).all():
+        # 标量平方距离判断，避免 np.isclose 分配布尔数组
+        dx = curr_end[0] - curr_start[0]
+        dy = curr_end[1] - curr_start[1]
+        dz = curr_end[2] - curr_start[2]
+        if dx * dx + dy * dy + dz * dz < 1e-16:
             # Handle null lines more gracefully
             self.update_by_attrs(start, end, buff=0, path_arc=self.path_arc)
             return self
@@ -85,9 +92,13 @@ class Cmpt_VPoints_LineImpl[ItemT](Cmpt_VPoints[ItemT]):
         else:
             self.path_arc = path_arc
 
-        builder = PathBuilder(start_point=start)
-        builder.arc_to(end, path_arc)
-        points = builder.get()
+        if path_arc == 0:
+            # 直线无需经过 PathBuilder 的弧线细分，直接构造三个点即可
+            points = np.array([start, (start + end) * 0.5, end])
+        else:
+            builder = PathBuilder(start_point=start)
+            builder.arc_to(end, path_arc)
+            points = builder.get()
 
         # Apply buffer
         if buff > 0:
@@ -138,25 +149,31 @@ class Cmpt_VPoints_LineImpl[ItemT](Cmpt_VPoints[ItemT]):
         # gives their centers
         rough_start = Cmpt_VPoints_LineImpl.pointify(start)
         rough_end = Cmpt_VPoints_LineImpl.pointify(end)
-        if np.isclose(rough_start, rough_end).all():
+        diff = rough_end - rough_start
+        if diff[0] * diff[0] + diff[1] * diff[1] + diff[2] * diff[2] < 1e-16:
             rough_end[0] += 1e-6
-        vect = normalize(rough_end - rough_start)
+            diff = rough_end - rough_start
+        vect = normalize(diff)
         # Now that we know the direction between them,
         # we can find the appropriate boundary point from
         # start and end, if they're items
         return (
             Cmpt_VPoints_LineImpl.pointify(start, vect),
-            Cmpt_VPoints_LineImpl.pointify(end, -vect)
+            Cmpt_VPoints_LineImpl.pointify(end, vect, sign=-1)
         )
 
     @staticmethod
     def pointify(
         item_or_data_or_point: SupportsPointify,
-        direction: Vect | None = None
+        direction: Vect | None = None,
+        *,
+        sign: float = 1
     ) -> np.ndarray:
         """
         Take an argument passed into Line (or subclass) and turn
         it into a 3d point.
+
+        ``sign=-1`` 时表示取 ``direction`` 的反方向，避免在调用处对数组取负
         """
         if isinstance(item_or_data_or_point, Points):
             cmpt = item_or_data_or_point.points
@@ -164,7 +181,7 @@ class Cmpt_VPoints_LineImpl[ItemT](Cmpt_VPoints[ItemT]):
             if direction is None:
                 return cmpt.box.center
             else:
-                return cmpt.box.get_continuous(direction)
+                return cmpt.box.get_continuous(direction if sign == 1 else -np.asarray(direction))
         else:
             point = item_or_data_or_point
             result = np.zeros(3)
@@ -172,10 +189,14 @@ class Cmpt_VPoints_LineImpl[ItemT](Cmpt_VPoints[ItemT]):
             return result
 
     @property
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
     def vector(self) -> np.ndarray:
         return self.get_end() - self.get_start()
 
     @property
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
     def unit_vector(self) -> np.ndarray:
         return normalize(self.vector)
 
@@ -192,7 +213,12 @@ class Cmpt_VPoints_LineImpl[ItemT](Cmpt_VPoints[ItemT]):
         return start + np.dot(point - start, unit_vect) * unit_vect
 
     def get_slope(self) -> float:
-        return np.tan(self.angle)
+        # tan(atan2(y, x)) 即 y / x，直接相除以避免两次三角函数调用
+        vect = self.vector
+        vx, vy = vect[0], vect[1]
+        if vx == 0:
+            return 0. if vy == 0 else math.copysign(math.inf, vy)
+        return vy / vx
 
     def set_angle(self, angle: float, about_point: Vect | None = None) -> Self:
         if about_point is None:
@@ -208,6 +234,8 @@ class Cmpt_VPoints_LineImpl[ItemT](Cmpt_VPoints[ItemT]):
         return self
 
     @property
+    @Cmpt_Points.set.self_refresh
+    @refresh.register
     def length(self) -> float:
         return get_norm(self.vector)
 
@@ -258,6 +286,20 @@ class Cmpt_VPoints_DashedLineImpl[ItemT](Cmpt_VPoints_LineImpl[ItemT], impl=True
         assert isinstance(sub, VItem)
         return sub.points.get_end()
 
+    # 虚线的端点取自子物件，自身的 set 信号无法感知其变化，因此这里不能缓存
+
+    @property
+    def vector(self) -> np.ndarray:
+        return self.get_end() - self.get_start()
+
+    @property
+    def unit_vector(self) -> np.ndarray:
+        return normalize(self.vector)
+
+    @property
+    def length(self) -> float:
+        return get_norm(self.vector)
+
 
 class DashedLine(Line, Group[VItem]):
     '''
@@ -290,9 +332,11 @@ class DashedLine(Line, Group[VItem]):
         '''
         基于线段长度计算所需虚线段的数量
         '''
+        if self.dash_length == 0:
+            return 2
         return max(
             2,
-            int(np.ceil((self.points.length / self.dash_length) * self.dashed_ratio)),
+            math.ceil((self.points.length / self.dash_length) * self.dashed_ratio),
         )
 
 
@@ -335,7 +379,8 @@ class Elbow(MarkedItem, VItem):
         super().__init__(**kwargs)
         self.points.set_as_corners([UP, UP + RIGHT, RIGHT])
         self.points.set_width(width, about_point=ORIGIN)
-        self.points.rotate(angle, about_point=ORIGIN)
+        if angle != 0:
+            self.points.rotate(angle, about_point=ORIGIN)
         self.mark.set_points([ORIGIN])
 
 
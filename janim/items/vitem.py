@@ -17,11 +17,10 @@ from janim.items.points import Group, Points
 from janim.locale.i18n import get_local_strings
 from janim.render.renderer_vitem import VItemRenderer
 from janim.typing import Alpha, AlphaArray, ColorArray, JAnimColor, Vect
-from janim.utils.bezier import (bezier, inverse_interpolate,
+from janim.utils.bezier import (inverse_interpolate,
                                 partial_quadratic_bezier_points)
 from janim.utils.data import AlignedData
 from janim.utils.simple_functions import clip
-from janim.utils.space_ops import get_norm
 
 _ = get_local_strings('vitem')
 
@@ -316,13 +315,15 @@ class DashedVItem(VItem, Group[VItem]):
 
         if equal_lengths == 'approx':
             # 参考 Cmpt_VPoints.curve_and_prop_of_partial_point
-            partials: list[float] = [0]
-            for tup in Cmpt_VPoints.get_bezier_tuples_from_points(points):
-                if np.isnan(tup[1]).all():
-                    arclen = 0
-                else:
-                    arclen = get_norm(tup[2] - tup[0])
-                partials.append(partials[-1] + arclen)
+            # 向量化计算各曲线的弦长前缀和，NAN_POINT 分隔处记 0
+            anchors_start = points[:-2:2]
+            anchors_end = points[2::2]
+            handles = points[1:-1:2]
+            arclens = np.linalg.norm(anchors_end - anchors_start, axis=1)
+            arclens[np.isnan(handles[:, 0])] = 0
+            partials = np.empty(len(arclens) + 1)
+            partials[0] = 0
+            np.cumsum(arclens, out=partials[1:])
             full = partials[-1]
 
             def get_curve_and_prop(alpha: float) -> tuple[int, float]:
@@ -330,8 +331,8 @@ class DashedVItem(VItem, Group[VItem]):
                     return (0, 0.0)
                 if full == 0:
                     return len(partials) - 2, 1.0
-                index = next(
-                    (i for i, x in enumerate(partials) if x >= full * alpha),
+                index = min(
+                    int(np.searchsorted(partials, full * alpha, side='left')),
                     len(partials) - 1
                 )
                 residue = float(inverse_interpolate(
@@ -361,14 +362,18 @@ class DashedVItem(VItem, Group[VItem]):
                 for dash_start, dash_end in zip(dash_starts, dash_ends)
             ]
         elif equal_lengths == 'equal':
-            norms = np.array(0)
             sample_points = 10
-            for tup in Cmpt_VPoints.get_bezier_tuples_from_points(points):
-                # 参考 Cmpt_VPoints.get_nth_curve_length_pieces
-                curve = bezier(tup)
-                samples = np.array([curve(a) for a in np.linspace(0, 1, sample_points)])
-                diffs = np.diff(samples, axis=0)
-                norms = np.append(norms, np.linalg.norm(diffs, axis=1))
+            # 参考 Cmpt_VPoints.get_nth_curve_length_pieces
+            # 对所有二次贝塞尔曲线一次性采样，替代逐曲线的 np.append 循环
+            a0 = points[:-2:2]
+            h = points[1:-1:2]
+            a1 = points[2::2]
+            t = np.linspace(0, 1, sample_points)[np.newaxis, :, np.newaxis]
+            samples = (1 - t)**2 * a0[:, np.newaxis] + 2 * t * (1 - t) * h[:, np.newaxis] + t**2 * a1[:, np.newaxis]
+            diffs = np.diff(samples, axis=1)
+            norms = np.empty(1 + diffs.shape[0] * diffs.shape[1])
+            norms[0] = 0
+            norms[1:] = np.linalg.norm(diffs, axis=2).reshape(-1)
             # add up length-pieces in array form
             length_vals = np.cumsum(norms)
             ref_points = np.linspace(0, 1, length_vals.size)
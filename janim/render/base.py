@@ -60,19 +60,19 @@ class Renderer:
         resize_target: int,
         use_32bit_align: bool = False
     ) -> None:
-        processed_data = resize_with_interpolation(new_data, resize_target)
+        processed_data = np.ascontiguousarray(resize_with_interpolation(new_data, resize_target))
         assert processed_data.dtype == np.float32
-        bytes_data = processed_data.tobytes()
 
         size = (
-            ((len(bytes_data) + 31) & ~31)
+            ((processed_data.nbytes + 31) & ~31)
             if use_32bit_align
-            else len(bytes_data)
+            else processed_data.nbytes
         )
         if size != vbo.size:
             vbo.orphan(size)
 
-        vbo.write(bytes_data)
+        # 直接写入 numpy 数组（缓冲协议），省去 tobytes 的一次完整拷贝
+        vbo.write(processed_data)
 
     @staticmethod
     def update_static_buffer_data(
@@ -80,13 +80,12 @@ class Renderer:
         vbo: mgl.Buffer,
         resize_target: int
     ) -> None:
-        processed_data = resize_with_interpolation(new_data, resize_target)
+        processed_data = np.ascontiguousarray(resize_with_interpolation(new_data, resize_target))
         assert processed_data.dtype == np.float32
-        bytes_data = processed_data.tobytes()
 
-        assert len(bytes_data) == vbo.size
+        assert processed_data.nbytes == vbo.size
 
-        vbo.write(bytes_data)
+        vbo.write(processed_data)
 
     @staticmethod
     @contextmanager
@@ -233,12 +233,13 @@ class VItemCurveRenderer(Renderer):
             )
 
         all_indices = indices_list[0] if len(indices_list) == 1 else np.vstack(indices_list)
-        bytes = all_indices.tobytes()
+        # vstack(...).T 不是 C 连续的，转为连续数组后直接写入，避免再经过 tobytes 拷贝一次
+        all_indices = np.ascontiguousarray(all_indices)
 
-        if len(bytes) != self.vbo_indices.size:
-            self.vbo_indices.orphan(len(bytes))
+        if all_indices.nbytes != self.vbo_indices.size:
+            self.vbo_indices.orphan(all_indices.nbytes)
 
-        self.vbo_indices.write(bytes)
+        self.vbo_indices.write(all_indices)
 
     def _update_points_compatibility(self, item: VItem, new_attrs: RenderAttrs) -> None:
         if new_attrs.points is not self.attrs.points \
@@ -254,12 +255,11 @@ class VItemCurveRenderer(Renderer):
                 self.points_vec4buffer = np.empty((len(mapped), 4), dtype=np.float32)
 
             self.points_vec4buffer[:, :3] = mapped
-            bytes = self.points_vec4buffer.tobytes()
 
-            if len(bytes) != self.vbo_mapped_points.size:
-                self.vbo_mapped_points.orphan(len(bytes))
+            if self.points_vec4buffer.nbytes != self.vbo_mapped_points.size:
+                self.vbo_mapped_points.orphan(self.points_vec4buffer.nbytes)
 
-            self.vbo_mapped_points.write(bytes)
+            self.vbo_mapped_points.write(self.points_vec4buffer)
             self.attrs.fix_in_frame = new_attrs.fix_in_frame
             self.attrs.camera_info = new_attrs.camera_info
             self.attrs.points = new_attrs.points
@@ -270,12 +270,11 @@ class VItemCurveRenderer(Renderer):
                 self.points_vec4buffer = np.empty((len(new_attrs.points), 4), dtype=np.float32)
 
             self.points_vec4buffer[:, :3] = new_attrs.points
-            bytes = self.points_vec4buffer.tobytes()
 
-            if len(bytes) != self.vbo_points.size:
-                self.vbo_points.orphan(len(bytes))
+            if self.points_vec4buffer.nbytes != self.vbo_points.size:
+                self.vbo_points.orphan(self.points_vec4buffer.nbytes)
 
-            self.vbo_points.write(bytes)
+            self.vbo_points.write(self.points_vec4buffer)
 
         if new_attrs.points is not self.attrs.points \
                 or new_attrs.fix_in_frame != self.attrs.fix_in_frame \
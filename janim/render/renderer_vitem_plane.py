@@ -301,9 +301,9 @@ class VItemPlaneRenderer(Renderer):
         ]) / new_attrs.camera_info.frame_radius
         clip_box = np.clip(clip_box, -1, 1)
 
-        bytes = clip_box.astype(np.float32).tobytes()
-        assert len(bytes) == self.vbo_coord.size
-        self.vbo_coord.write(bytes)
+        clip_box = clip_box.astype(np.float32)
+        assert clip_box.nbytes == self.vbo_coord.size
+        self.vbo_coord.write(clip_box)
 
     def _update_points_compatibility(self, item: VItem, new_attrs: RenderAttrs) -> None:
         if new_attrs.points is not self.attrs.points \
@@ -320,12 +320,11 @@ class VItemPlaneRenderer(Renderer):
 
             self.points_vec4buffer[:, :2] = mapped
             self.points_vec4buffer[:, 2] = item.points.get_closepath_flags().astype(np.float32)
-            bytes = self.points_vec4buffer.tobytes()
 
-            if len(bytes) != self.vbo_mapped_points.size:
-                self.vbo_mapped_points.orphan(len(bytes))
+            if self.points_vec4buffer.nbytes != self.vbo_mapped_points.size:
+                self.vbo_mapped_points.orphan(self.points_vec4buffer.nbytes)
 
-            self.vbo_mapped_points.write(bytes)
+            self.vbo_mapped_points.write(self.points_vec4buffer)
             self.attrs.fix_in_frame = new_attrs.fix_in_frame
             self.attrs.camera_info = new_attrs.camera_info
             self.attrs.points = new_attrs.points
@@ -337,12 +336,11 @@ class VItemPlaneRenderer(Renderer):
 
             self.points_vec4buffer[:, :3] = new_attrs.points
             self.points_vec4buffer[:, 3] = item.points.get_closepath_flags().astype(np.float32)
-            bytes = self.points_vec4buffer.tobytes()
 
-            if len(bytes) != self.vbo_points.size:
-                self.vbo_points.orphan(len(bytes))
+            if self.points_vec4buffer.nbytes != self.vbo_points.size:
+                self.vbo_points.orphan(self.points_vec4buffer.nbytes)
 
-            self.vbo_points.write(bytes)
+            self.vbo_points.write(self.points_vec4buffer)
 
         if new_attrs.points is not self.attrs.points \
                 or new_attrs.fix_in_frame != self.attrs.fix_in_frame \
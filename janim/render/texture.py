@@ -26,6 +26,20 @@ def get_img_from_file(file_path: str) -> Image.Image:
 # 存在新的 Image 对象与先前已经释放的 Image 对象具有相同 id 的可能
 # 所以这里使用 ref，从而检查 Image 对象是否被释放掉
 img_to_texture_map: dict[tuple[mgl.Context, int], tuple[mgl.Texture, weakref.ref]] = {}
+img_to_bytes_map: dict[int, tuple[bytes, weakref.ref]] = {}
+
+
+def get_bytes_from_img(img: Image.Image) -> bytes:
+    '''
+    缓存 ``img.tobytes()`` 的结果，使得同一图像向多个上下文上传纹理时无需重复编码
+    '''
+    key = id(img)
+    data, ref = img_to_bytes_map.get(key, (None, None))
+    if data is not None and ref() is not None:
+        return data
+    data = img.tobytes()
+    img_to_bytes_map[key] = (data, weakref.ref(img))
+    return data
 
 
 def get_texture_from_img(img: Image.Image) -> mgl.Texture:
@@ -37,7 +51,7 @@ def get_texture_from_img(img: Image.Image) -> mgl.Texture:
     texture = ctx.texture(
         size=img.size,
         components=len(img.getbands()),
-        data=img.tobytes()
+        data=get_bytes_from_img(img)
     )
     texture.repeat_x = False
     texture.repeat_y = False
@@ -184,7 +184,10 @@ def quadratic_bezier_points_for_arc(
     '''得到使用二次贝塞尔曲线模拟的圆弧'''
     n_points = 2 * n_components + 1
     angles = np.linspace(start_angle, start_angle + angle, n_points)
-    points = np.array([np.cos(angles), np.sin(angles), np.zeros(n_points)]).T
+    points = np.empty((n_points, 3))
+    np.cos(angles, out=points[:, 0])
+    np.sin(angles, out=points[:, 1])
+    points[:, 2] = 0
     # Adjust handles
     theta = angle / n_components
     points[1::2] /= np.cos(theta / 2)
@@ -652,10 +655,5 @@ def get_quadratic_approximation_of_cubic(
     i1 = find_intersection(a1, T1, mid, Tm)
 
     m, n = np.shape(a0)
-    result = np.zeros((5 * m, n))
-    result[0::5] = a0
-    result[1::5] = i0
-    result[2::5] = mid
-    result[3::5] = i1
-    result[4::5] = a1
-    return result
+    # 单次连续拷贝完成交错排列，替代五次跨步写入
+    return np.stack((a0, i0, mid, i1, a1), axis=1).reshape(5 * m, n)
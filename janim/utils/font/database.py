@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Callable
 
 import freetype as FT
@@ -143,6 +144,7 @@ def get_database() -> FontDatabase:
     return _database
 
 
+@lru_cache(maxsize=256)
 def get_font_info_by_attrs(
     name: str,
     weight: int | Weight | WeightName,
@@ -213,8 +215,9 @@ class Font:
         array: np.ndarray
         advance: tuple[int, int]
 
-    def get_glyph_data(self, char: str) -> tuple[np.ndarray, tuple[int, int]]:
-        value = ord(char)
+    def get_glyph_data(self, char: str | int) -> tuple[np.ndarray, tuple[int, int]]:
+        # 也可以直接传入码点，免去调用方往返 ord/chr 的转换
+        value = char if isinstance(char, int) else ord(char)
         cached = self.cached_glyph.get(value, None)
         if cached is not None:
             return cached.array, cached.advance
@@ -228,7 +231,8 @@ class Font:
 
         def wrap_points(func: Callable) -> Callable:
             def wrapper(*args) -> None:
-                func(*[np.array([p.x, p.y, 0]) for p in args[:-1]])
+                # PathBuilder 接受元组，这里避免为每个轮廓点构造一个小数组
+                func(*[(p.x, p.y, 0.0) for p in args[:-1]])
             return wrapper
 
         # 解析轮廓
@@ -3,9 +3,8 @@ from __future__ import annotations
 import gc
 import inspect
 import weakref
-from collections import defaultdict
 from dataclasses import dataclass
-from functools import lru_cache, partial, update_wrapper
+from functools import partial, update_wrapper
 from typing import Callable, Concatenate, Self, overload
 
 import janim.utils.refresh as refresh
@@ -16,10 +15,12 @@ type FullQualname = str
 SIGNAL_OBJ_SLOTS_NAME = '__signal_obj_slots'
 
 
+# refresh 槽在注册时就解析出方法名，emit 时直接把字符串传给 mark_refresh，
+# 免去每次触发时再从函数对象取 __name__
 class _SelfSlots:
     def __init__(self):
         self.normal_slots: list[Callable] = []
-        self.refresh_slots: list[Callable] = []
+        self.refresh_slots: list[str] = []
         self.refresh_slots_with_recurse: list[_SelfSlotWithRecurse] = []
 
 
@@ -31,7 +32,7 @@ class _ObjSlots:
 
 @dataclass
 class _SelfSlotWithRecurse:
-    func: Callable
+    name: str
     recurse_up: bool
     recurse_down: bool
 
@@ -39,19 +40,25 @@ class _SelfSlotWithRecurse:
 @dataclass
 class _RefreshSlot:
     obj: weakref.ReferenceType[refresh.Refreshable]
-    func: Callable | str
+    name: str
 
 
 class Signal[T, **P, R]:
     # for gc
-    objects_with_slots: weakref.WeakSet[defaultdict[tuple[Signal, Key], _ObjSlots]] = weakref.WeakSet()
+    objects_with_slots: weakref.WeakSet[dict[tuple[Signal, Key], _ObjSlots]] = weakref.WeakSet()
 
     def __init__(self, func: Callable[Concatenate[T, P], R]):
         self.func = func
+        self._func_get = func.__get__
         update_wrapper(self, func)
 
-        self.all_slots: defaultdict[FullQualname, defaultdict[Key, _SelfSlots]] \
-            = defaultdict(lambda: defaultdict(_SelfSlots))
+        # 注册时使用 setdefault 填充，emit 时只用 .get 查询
+        # 这样空键不会触发 defaultdict 的工厂而在热路径上凭空创建条目
+        self.all_slots: dict[FullQualname, dict[Key, _SelfSlots]] = {}
+
+        # 以发送者的类为键，缓存沿 mro 收集好的槽列表
+        # 槽的注册都发生在类定义时（早于任何 emit），因此无需失效处理
+        self._cls_slots_cache: dict[type, dict[Key, _SelfSlots]] = {}
 
     # region typing
 
@@ -61,7 +68,9 @@ class Signal[T, **P, R]:
     def __get__(self, instnace: object, owner) -> Callable[P, R]: ...
 
     def __get__(self, instance, owner):
-        return self if instance is None else self.func.__get__(instance, owner)
+        # 不能把绑定方法缓存进 instance.__dict__：
+        # Component.copy 使用 copy.copy，浅拷贝会把绑定到原对象的方法带进副本
+        return self if instance is None else self._func_get(instance, owner)
 
     def __call__(self, *args, **kwargs):    # pragma: no cover
         return self.func(*args, **kwargs)
@@ -81,9 +90,12 @@ class Signal[T, **P, R]:
     def _get_cls_full_qualname(cls: type) -> str:
         return f'{cls.__module__}.{cls.__qualname__}'
 
-    @lru_cache
-    def _get_cls_slots(self, cls: type) -> defaultdict[Key, _SelfSlots]:
-        result: defaultdict[Key, _SelfSlots] = defaultdict(_SelfSlots)
+    def _get_cls_slots(self, cls: type) -> dict[Key, _SelfSlots]:
+        result = self._cls_slots_cache.get(cls)
+        if result is not None:
+            return result
+
+        result: dict[Key, _SelfSlots] = {}
 
         for sup in cls.mro():
             full_qualname = self._get_cls_full_qualname(sup)
@@ -93,22 +105,23 @@ class Signal[T, **P, R]:
                 continue
 
             for key, value in sup_slots.items():
-                r = result[key]
+                r = result.setdefault(key, _SelfSlots())
                 r.normal_slots.extend(value.normal_slots)
                 r.refresh_slots.extend(value.refresh_slots)
                 r.refresh_slots_with_recurse.extend(value.refresh_slots_with_recurse)
 
+        self._cls_slots_cache[cls] = result
         return result
 
     @staticmethod
-    def _get_obj_slots(sender: object) -> defaultdict[tuple[Signal, Key], _ObjSlots] | None:
+    def _get_obj_slots(sender: object) -> dict[tuple[Signal, Key], _ObjSlots] | None:
         return getattr(sender, SIGNAL_OBJ_SLOTS_NAME, None)
 
     @staticmethod
-    def _get_obj_slots_with_default(sender: object) -> defaultdict[tuple[Signal, Key], _ObjSlots]:
+    def _get_obj_slots_with_default(sender: object) -> dict[tuple[Signal, Key], _ObjSlots]:
         obj_slots = getattr(sender, SIGNAL_OBJ_SLOTS_NAME, None)
         if obj_slots is None:
-            obj_slots = defaultdict(_ObjSlots)
+            obj_slots = {}
             Signal.objects_with_slots.add(sender)
             setattr(sender, SIGNAL_OBJ_SLOTS_NAME, obj_slots)
         return obj_slots
@@ -117,6 +130,13 @@ class Signal[T, **P, R]:
 
     # region slots
 
+    def _slots_for(self, full_qualname: str, key: str) -> _SelfSlots:
+        slots_by_key = self.all_slots.setdefault(full_qualname, {})
+        slots = slots_by_key.get(key, None)
+        if slots is None:
+            slots = slots_by_key[key] = _SelfSlots()
+        return slots
+
     def self_slot(self, func=None, /, *, key: str = ''):
         '''
         被修饰的方法会在 ``Signal`` 触发时被调用
@@ -131,7 +151,7 @@ class Signal[T, **P, R]:
         return self._self_slot(full_qualname, func)
 
     def _self_slot[T](self, full_qualname: str, func: T, key: str = '') -> T:
-        self.all_slots[full_qualname][key].normal_slots.append(func)
+        self._slots_for(full_qualname, key).normal_slots.append(func)
         return func
 
     def self_refresh(self, func=None, *, key: str = ''):
@@ -148,7 +168,7 @@ class Signal[T, **P, R]:
         return self._self_refresh(full_qualname, func)
 
     def _self_refresh[T](self, full_qualname: str, func: T, key: str = '') -> T:
-        self.all_slots[full_qualname][key].refresh_slots.append(func)
+        self._slots_for(full_qualname, key).refresh_slots.append(func.__name__)
         return func
 
     def self_refresh_with_recurse(self, *, recurse_up: bool = False, recurse_down: bool = False, key: str = ''):
@@ -159,8 +179,8 @@ class Signal[T, **P, R]:
         '''
         def decorator(func):
             full_qualname = self._get_cls_full_qualname_from_fback()
-            slot = _SelfSlotWithRecurse(func, recurse_up, recurse_down)
-            self.all_slots[full_qualname][key].refresh_slots_with_recurse.append(slot)
+            slot = _SelfSlotWithRecurse(func.__name__, recurse_up, recurse_down)
+            self._slots_for(full_qualname, key).refresh_slots_with_recurse.append(slot)
             return func
 
         return decorator
@@ -170,31 +190,38 @@ class Signal[T, **P, R]:
         使 ``func`` 会在 ``Signal`` 触发时被调用
         '''
         obj_slots = self._get_obj_slots_with_default(sender)
-        obj_slots[(self, key)].normal_slots.append(func)
+        slots = obj_slots.get((self, key), None)
+        if slots is None:
+            slots = obj_slots[(self, key)] = _ObjSlots()
+        slots.normal_slots.append(func)
 
     def connect_refresh(self, sender: object, obj: object, func: Callable | str, *, key: str = '') -> None:
         '''
         使 ``func`` 会在 ``Signal`` 触发时被标记为需要重新计算
         '''
         obj_slots = self._get_obj_slots_with_default(sender)
-        slot = _RefreshSlot(weakref.ref(obj), func)
-        obj_slots[(self, key)].refresh_slots.append(slot)
+        slot = _RefreshSlot(weakref.ref(obj), func.__name__ if callable(func) else func)
+        slots = obj_slots.get((self, key), None)
+        if slots is None:
+            slots = obj_slots[(self, key)] = _ObjSlots()
+        slots.refresh_slots.append(slot)
 
     def emit(self, sender: object, *args, key: str = '', **kwargs):
         cls_slots = self._get_cls_slots(sender.__class__)
-        slots = cls_slots[key]
+        slots = cls_slots.get(key, None)
 
-        # @self_slot
-        for func in slots.normal_slots:
-            func(sender, *args, **kwargs)
+        if slots is not None:
+            # @self_slot
+            for func in slots.normal_slots:
+                func(sender, *args, **kwargs)
 
-        # @self_refresh
-        for func in slots.refresh_slots:
-            sender.mark_refresh(func)
+            # @self_refresh
+            for name in slots.refresh_slots:
+                sender.mark_refresh(name)
 
-        # @self_refresh_with_recurse
-        for slot in slots.refresh_slots_with_recurse:
-            sender.mark_refresh(slot.func, recurse_up=slot.recurse_up, recurse_down=slot.recurse_down)
+            # @self_refresh_with_recurse
+            for slot in slots.refresh_slots_with_recurse:
+                sender.mark_refresh(slot.name, recurse_up=slot.recurse_up, recurse_down=slot.recurse_down)
 
         ####
 
@@ -214,7 +241,7 @@ class Signal[T, **P, R]:
             obj = slot.obj()
             if obj is None:
                 continue    # pragma: no cover
-            obj.mark_refresh(slot.func)
+            obj.mark_refresh(slot.name)
 
 
 def _signal_gc_callback(phase: str, info: dict) -> None:
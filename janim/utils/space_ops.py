@@ -25,6 +25,18 @@ def get_norm(vect: Iterable) -> float:
     return sum((x**2 for x in vect))**0.5
 
 
+def consider_points_equal(p0: Iterable, p1: Iterable, *, atol: float = 1e-8) -> bool:
+    '''
+    判断两个三维点是否几乎重合
+
+    比起 ``np.isclose(p0, p1).all()``，直接比较平方距离不产生中间数组
+    '''
+    dx = p1[0] - p0[0]
+    dy = p1[1] - p0[1]
+    dz = p1[2] - p0[2]
+    return dx * dx + dy * dy + dz * dz < atol * atol
+
+
 def det(a: Iterable, b: Iterable) -> float:
     return a[0] * b[1] - a[1] * b[0]
 
@@ -32,7 +44,7 @@ def det(a: Iterable, b: Iterable) -> float:
 def normalize(vect: np.ndarray, fall_back: np.ndarray | None = None) -> np.ndarray:
     norm = get_norm(vect)
     if norm > 0:
-        return np.array(vect) / norm
+        return np.asarray(vect) / norm
     elif fall_back is not None:
         return fall_back
     else:
@@ -255,7 +267,7 @@ def complex_func_to_R3_func(
 
 
 def center_of_mass(points: Iterable[npt.ArrayLike]) -> np.ndarray:
-    points = [np.array(point).astype("float") for point in points]
+    points = [np.asarray(point, dtype=float) for point in points]
     return sum(points) / len(points)
 
 
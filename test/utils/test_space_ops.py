@@ -1,6 +1,9 @@
 import unittest
 
+import numpy as np
+
 from janim.utils.space_ops import (angle_axis_from_quaternion,
+                                   consider_points_equal,
                                    quaternion_from_angle_axis, rotate_vector,
                                    rotation_matrix,
                                    rotation_matrix_from_quaternion)
@@ -56,6 +59,12 @@ class TestQuaternionOperations(unittest.TestCase):
             for j in range(3):
                 self.assertAlmostEqual(R[i][j], expected_R[i][j], places=6)
 
+    def test_consider_points_equal(self):
+        self.assertTrue(consider_points_equal([1.0, 2.0, 3.0], [1.0, 2.0, 3.0]))
+        self.assertTrue(consider_points_equal(np.array([0.0, 0.0, 0.0]), np.array([1e-9, 0.0, 0.0])))
+        self.assertFalse(consider_points_equal([0.0, 0.0, 0.0], [1e-6, 0.0, 0.0]))
+        self.assertFalse(consider_points_equal([0.0, 0.0, 0.0], [0.0, 0.0, 1.0]))
+
 
 if __name__ == '__main__':
     unittest.main()